@@ -6,11 +6,52 @@
 
 import sys
 import argparse
+import errno
+import os
 import shutil
 
 from pathlib import Path
 
 
+def _fast_copy(src, dst):
+    """Copies a file's contents and metadata, keeping the bytes in the kernel.
+
+    This is a drop-in replacement for shutil.copy2 as a copytree
+    copy_function. It uses copy_file_range (which can reflink on CoW
+    filesystems), else shutil.copyfile, e.g. when copy_file_range is not
+    available or fails for the given pair of files.
+    """
+    remaining = -1
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            remaining = os.fstat(src_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                remaining = -1
+    if remaining != 0:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _link_or_copy(src, dst):
+    """Hardlinks a file, copying it instead if it is on another filesystem."""
+    try:
+        os.link(src, dst)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+            raise
+        _fast_copy(src, dst)
+    return dst
+
+
 def main():
     params = argparse.ArgumentParser(
         description="Copy all files in a directory tree and touch a stamp file")
@@ -18,6 +59,11 @@ def main():
     params.add_argument("target", type=Path)
     params.add_argument("stamp", type=Path)
     params.add_argument("--ignore_pattern", action="append")
+    params.add_argument(
+        "--link",
+        action="store_true",
+        help="Hardlink files instead of copying them. Only use this when "
+        "neither the source nor the target tree is modified afterwards.")
     args = params.parse_args()
 
     if args.target.is_file():
@@ -29,7 +75,12 @@ def main():
     if args.ignore_pattern:
         ignore = shutil.ignore_patterns(*args.ignore_pattern)
 
-    shutil.copytree(args.source, args.target, symlinks=True, ignore=ignore)
+    shutil.copytree(
+        args.source,
+        args.target,
+        symlinks=True,
+        ignore=ignore,
+        copy_function=_link_or_copy if args.link else _fast_copy)
 
     stamp = Path(str(args.stamp))
     stamp.touch()
@@ -37,11 +37,29 @@ where the path before the '=' is the destination path in the package, and the
 path after the '=' is the source file (rebased to the root build directory).
 """
 
-from collections import defaultdict
 import argparse
 import json
 import os
 import sys
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+
+
+def _create_merger(merged_config, category, values):
+    """Returns a callable that merges values into merged_config[category].
+
+    The merge strategy is chosen once per category from the shape of its first
+    value: dicts are updated, lists are extended, and anything else is replaced.
+    """
+    if isinstance(values, dict):
+        merged_config[category] = {}
+        return merged_config[category].update
+    if isinstance(values, list):
+        merged_config[category] = []
+        return merged_config[category].extend
+    return partial(merged_config.__setitem__, category)
 
 
 def main():
@@ -77,22 +95,25 @@ def main():
     # failing immediately on the first conflict. This allows us to print a more
     # useful build failure so that developers don't need to play whack-a-mole with
     # multiple conflicts.
-    configs = []
-    files_by_service = defaultdict(list)
-    for config_file in sysmgr_config_files:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-            configs.append(config)
-
-            services = config.get('services')
-            if services:
-                for service in services.keys():
-                    files_by_service[service].append(config_file)
+    configs = [
+        json.loads(Path(config_file).read_bytes())
+        for config_file in sysmgr_config_files
+    ]
+
+    # Pair each service with the file providing it. After a stable sort by
+    # service, any duplicates are adjacent and still listed in config order.
+    service_files = [
+        (service, config_file)
+        for config_file, config in zip(sysmgr_config_files, configs)
+        for service in config.get('services') or {}
+    ]
+    service_files.sort(key=itemgetter(0))
 
     # If any conflicts were detected, print a useful error message and then
     # exit.
     service_conflicts = False
-    for service, config_files in files_by_service.items():
+    for service, group in groupby(service_files, key=itemgetter(0)):
+        config_files = [config_file for _, config_file in group]
         if len(config_files) > 1:
             print(
                 'Duplicate sysmgr configuration for service {} in files: {}'.
@@ -104,15 +125,14 @@ def main():
 
     # Create a single merged configuration analogous to sysmgr's init itself.
     merged_config = {}
+    mergers = {}
     for config in configs:
         for category, values in config.items():
-            existing = merged_config.get(category)
-            if type(existing) is dict:
-                merged_config[category].update(values)
-            elif type(existing) is list:
-                merged_config[category] += values
-            else:
-                merged_config[category] = values
+            merge = mergers.get(category)
+            if not merge:
+                merge = _create_merger(merged_config, category, values)
+                mergers[category] = merge
+            merge(values)
 
     json.dump(
         merged_config,
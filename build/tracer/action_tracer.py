@@ -762,14 +762,16 @@ def main():
     trace_output_dir = os.path.dirname(args.trace_output)
     os.makedirs(trace_output_dir, exist_ok=True)
 
-    os.environ["FSAT_BUF_SIZE"] = "5000000"
+    env = os.environ.copy()
+    env["FSAT_BUF_SIZE"] = "5000000"
     retval = subprocess.call(
         [
             args.fsatrace_path,
             "erwmdt",
             args.trace_output,
             "--",
-        ] + command.tokens)
+        ] + command.tokens,
+        env=env)
 
     # Scripts with known issues
     # TODO(shayba): file bugs for the suppressions below
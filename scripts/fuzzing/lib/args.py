@@ -382,22 +382,24 @@ class ArgParser(argparse.ArgumentParser):
         expected, see _add_libfuzzer_inputs().
         """
         if self._has_libfuzzer_extras:
+            try:
+                cut = args.index('--')
+            except ValueError:
+                cut = len(args)
+            subprocess_args = list(args[cut + 1:])
             libfuzzer_opts = {}
-            pass_to_subprocess = False
-            subprocess_args = []
             valid = []
-            for arg in args:
-                libfuzzer_opt = ArgParser.LIBFUZZER_OPT_RE.match(arg)
-                if pass_to_subprocess:
-                    subprocess_args.append(arg)
-                elif arg == '--':
-                    pass_to_subprocess = True
-                elif libfuzzer_opt:
-                    libfuzzer_opts[libfuzzer_opt.group(
-                        1)] = libfuzzer_opt.group(2)
-                elif (ArgParser.SHORT_OPT_RE.match(arg) or
-                      ArgParser.LONG_OPT_RE.match(arg) or
-                      ArgParser.POSITIONAL_RE.match(arg)):
+            libfuzzer_opt_match = ArgParser.LIBFUZZER_OPT_RE.match
+            short_opt_match = ArgParser.SHORT_OPT_RE.match
+            long_opt_match = ArgParser.LONG_OPT_RE.match
+            positional_match = ArgParser.POSITIONAL_RE.match
+            for arg in args[:cut]:
+                libfuzzer_opt = libfuzzer_opt_match(arg)
+                if libfuzzer_opt:
+                    key, val = libfuzzer_opt.groups()
+                    libfuzzer_opts[key] = val
+                elif (short_opt_match(arg) or long_opt_match(arg) or
+                      positional_match(arg)):
                     valid.append(arg)
                 else:
                     self.error('Unrecognized option: {}'.format(arg))
@@ -31,6 +31,9 @@ class BuildEnv(object):
       llvm_prodata:     Path to the LLVM/Clang profile data tool.
   """
 
+    # Matches the kernel log prefixes stripped from symbolized output.
+    KLOG_RE = re.compile(r'[0-9\[\]\.]*\[klog\] INFO: ')
+
     def __init__(self, factory):
         assert factory, 'Factory not set.'
         self._factory = factory
@@ -326,7 +329,7 @@ class BuildEnv(object):
         if not addrs:
             self.host.error('Unable to find device.', 'Try "fx set-device".')
 
-        addrs = addrs.split('\n')
+        addrs = addrs.splitlines()
         if len(addrs) != 1:
             self.host.error('Multiple devices found.', 'Try "fx set-device".')
         return addrs[0]
@@ -349,7 +352,7 @@ class BuildEnv(object):
             self.host.error('Unable to find device.', 'Try "fx set-device".')
 
         # Try parsing the returned values
-        devices = list_devices_out.split('\n')
+        devices = list_devices_out.splitlines()
 
         if devices:
             if not device_name:
@@ -389,7 +392,7 @@ class BuildEnv(object):
         out, _ = popened.communicate(raw)
         if popened.returncode != 0:
             out = ''
-        return re.sub(r'[0-9\[\]\.]*\[klog\] INFO: ', '', out)
+        return BuildEnv.KLOG_RE.sub('', out)
 
     def testsharder(self, executable_url, out_dir, realm_label=None):
         """Shards the available tests into _one_ test shard per environment for
@@ -5,14 +5,18 @@
 
 import os
 import sys
-import unittest
+from multiprocessing.pool import ThreadPool
 
 from host import Host
-from fuzzer import Fuzzer
 
 # This file contains the top-level implementations for each of the subcommands
 # for "fx fuzz".
 
+# How long "fx fuzz check" waits for its status probes, in seconds. This only
+# needs to be long enough to never expire: on Python 2.7, waiting without a
+# timeout can't be interrupted by Ctrl-C.
+_PROBE_TIMEOUT = 24 * 60 * 60
+
 
 def list_fuzzers(args, factory):
     """Implementation of "fx fuzz list"."""
@@ -77,33 +81,68 @@ def start_fuzzer(args, factory):
             'Output written to: {}.'.format(fuzzer.output))
 
 
+def _probe_fuzzer(fuzzer):
+    """Returns a fuzzer's (resolved, running, corpus, artifacts) status.
+
+    This is run on a worker thread by check_fuzzer. A SystemExit raised by
+    Host.error is returned rather than raised, so that it can be re-raised on
+    the main thread instead of silently killing the worker.
+    """
+    try:
+        resolved = fuzzer.is_resolved()
+        running = resolved and fuzzer.is_running()
+        corpus = fuzzer.corpus.measure() if resolved else None
+        return resolved, running, corpus, fuzzer.list_artifacts()
+    except SystemExit as e:
+        return e
+
+
 def check_fuzzer(args, factory):
     """Implementation of "fx fuzz check"."""
-    blank = True
-    for fuzzer in factory.buildenv.fuzzers(args.name):
-        if not args.name and not fuzzer.is_running():
-            continue
-        if not fuzzer.is_resolved():
-            factory.host.echo('{}: NOT INSTALLED'.format(fuzzer))
-        elif fuzzer.is_running(refresh=True):
-            factory.host.echo('{}: RUNNING'.format(fuzzer))
-        else:
-            factory.host.echo('{}: STOPPED'.format(fuzzer))
-        if fuzzer.is_resolved():
-            num, size = fuzzer.corpus.measure()
-            factory.host.echo(
-                '    Corpus size:  {} inputs / {} bytes'.format(num, size))
-        artifacts = fuzzer.list_artifacts()
-        if artifacts:
-            factory.host.echo('    Artifacts:')
-            for artifact in artifacts:
-                factory.host.echo('        {}'.format(artifact))
-        factory.host.echo('')
-        blank = False
-    if blank:
+    # The filter and probes below share the device's cached component status.
+    # Refresh it once here, so that the worker threads only read it and don't
+    # race to re-run `cs info`.
+    factory.device.refresh_cs_info()
+
+    fuzzers = factory.buildenv.fuzzers(args.name)
+    if not args.name:
+        fuzzers = [fuzzer for fuzzer in fuzzers if fuzzer.is_running()]
+    if not fuzzers:
         factory.host.echo(
             'No fuzzers are running.',
             'Include \'name\' to check specific fuzzers.')
+        return
+
+    # Each fuzzer's status queries are independent SSH round trips, so issue
+    # them concurrently and report the results in order. On Python 2.7,
+    # ThreadPool.map() blocks in a wait that Ctrl-C can't interrupt; waiting
+    # with a timeout keeps KeyboardInterrupt working against a hung device.
+    pool = ThreadPool(min(len(fuzzers), 16))
+    try:
+        statuses = pool.map_async(_probe_fuzzer, fuzzers).get(_PROBE_TIMEOUT)
+    finally:
+        pool.terminate()
+
+    for fuzzer, status in zip(fuzzers, statuses):
+        if isinstance(status, SystemExit):
+            raise status
+        resolved, running, corpus, artifacts = status
+        if not resolved:
+            lines = ['{}: NOT INSTALLED'.format(fuzzer)]
+        elif running:
+            lines = ['{}: RUNNING'.format(fuzzer)]
+        else:
+            lines = ['{}: STOPPED'.format(fuzzer)]
+        if resolved:
+            num, size = corpus
+            lines.append(
+                '    Corpus size:  {} inputs / {} bytes'.format(num, size))
+        if artifacts:
+            lines.append('    Artifacts:')
+            lines.extend(
+                '        {}'.format(artifact) for artifact in artifacts)
+        lines.append('')
+        factory.host.echo(*lines)
 
 
 def stop_fuzzer(args, factory):
@@ -161,6 +200,8 @@ def update_corpus(args, factory):
 
 
 def _run_tests(pattern, factory):
+    # Only the test subcommands need unittest, so import it lazily.
+    import unittest
     lib_dir = os.path.dirname(os.path.abspath(__file__))
     test_dir = os.path.join(os.path.dirname(lib_dir), 'test')
     tests = unittest.defaultTestLoader.discover(test_dir, pattern=pattern)
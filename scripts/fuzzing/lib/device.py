@@ -28,6 +28,22 @@ class Device(object):
          ssh_verbosity:    How verbose SSH processes are, from 0 to 3.
     """
 
+    # Shared SSH connection socket. This is kept short and per-user: the
+    # socket path must fit in sun_path (104 bytes on macOS) even after ssh
+    # appends a temporary suffix, and "%C" (a hash of the local host, remote
+    # host, port and remote user) does not include the local user.
+    CONTROL_PATH = '~/.ssh/fx-fuzz-%C'
+
+    # Matches the component URLs in the output of `cs info`.
+    CS_URL_RE = re.compile(r'^URL: (?P<url>.*)', re.MULTILINE)
+
+    # Matches the sizes and names in the output of `ls -l`, e.g.
+    # '-rw-r--r-- 1 0 0 8192 Mar 18 22:02 some-name'.
+    LS_RE = re.compile(
+        r'^(?:\S+[ \t]+){4}(?P<size>\d+)[ \t]+'
+        r'(?:\S+[ \t]+){3}(?P<name>.+?)[ \t]*$',
+        re.MULTILINE)
+
     def __init__(self, factory, name=None, addr=None):
         assert factory, 'Factory for device not set.'
         self._factory = factory
@@ -36,6 +52,7 @@ class Device(object):
         self._ssh_options = {}
         self._ssh_config_options = []
         self._ssh_verbosity = 0
+        self._ssh_opts = None
         self._reachable = None
         self._urls = None
 
@@ -64,6 +81,7 @@ class Device(object):
     @port.setter
     def port(self, port):
         self._ssh_options['P'] = str(port)
+        self._ssh_opts = None
 
     @property
     def ssh_config(self):
@@ -76,6 +94,7 @@ class Device(object):
             raise ValueError(
                 'Invalid SSH configuration file: {}'.format(ssh_config))
         self._ssh_options['F'] = ssh_config
+        self._ssh_opts = None
 
     @property
     def ssh_identity(self):
@@ -88,6 +107,7 @@ class Device(object):
             raise ValueError(
                 'Invalid SSH identity file: {}'.format(ssh_identity))
         self._ssh_options['i'] = ssh_identity
+        self._ssh_opts = None
 
     @property
     def ssh_options(self):
@@ -108,6 +128,7 @@ class Device(object):
         if ssh_verbosity < 0 or ssh_verbosity > 3:
             raise ValueError('Invalid ssh_verbosity: {}'.format(ssh_verbosity))
         self._ssh_verbosity = ssh_verbosity
+        self._ssh_opts = None
 
     @property
     def reachable(self):
@@ -125,8 +146,24 @@ class Device(object):
         with self.host.open(self.buildenv.abspath('//.fx-ssh-path')) as f:
             self.ssh_identity = f.readline().strip('\n')
 
+        # Multiplex SSH and SCP invocations over a single connection, so that
+        # only the first one pays for the handshake. The master connection
+        # persists briefly so that back-to-back "fx fuzz" commands share it.
+        self.ssh_options = [
+            'ControlMaster=auto',
+            'ControlPath={}'.format(Device.CONTROL_PATH),
+            'ControlPersist=60s',
+        ]
+
     def ssh_opts(self):
         """Returns the SSH executable and options."""
+        # The configuration options list is returned by the ssh_options
+        # property and may be modified in place, so the cached result is keyed
+        # on its contents. The other options are only changed by setters, which
+        # clear the cache.
+        config_options = tuple(self._ssh_config_options)
+        if self._ssh_opts and self._ssh_opts[0] == config_options:
+            return list(self._ssh_opts[1])
         ssh_options = []
 
         # Flags
@@ -141,7 +178,8 @@ class Device(object):
         for val in sorted(self._ssh_config_options):
             ssh_options += ['-o', val]
 
-        return ssh_options
+        self._ssh_opts = (config_options, ssh_options)
+        return list(ssh_options)
 
     def ssh(self, args, **kwargs):
         """Creates a Process with added SSH arguments.
@@ -162,7 +200,7 @@ class Device(object):
 
         # Explicitly prevent the subprocess from inheriting our stdin
         if not process.stdin:
-            process.stdin = Host.DEVNULL
+            process.stdin = Host.devnull()
 
         return process
 
@@ -186,16 +224,18 @@ class Device(object):
         if not self.reachable:
             return False
         if self._urls == None or refresh:
-            self._urls = []
-            out = self.ssh(['cs', 'info']).check_output()
-            pat = re.compile(r'^URL: (?P<url>.*)')
-            for line in str(out).split('\n'):
-                match = pat.match(line)
-                if not match:
-                    continue
-                self._urls.append(match.group('url'))
+            self.refresh_cs_info()
         return url in self._urls
 
+    def refresh_cs_info(self):
+        """Re-runs `cs info` and caches the URLs of the running components."""
+        self._urls = []
+        if not self.reachable:
+            return
+        out = self.ssh(['cs', 'info']).check_output()
+        for match in Device.CS_URL_RE.finditer(str(out)):
+            self._urls.append(match.group('url'))
+
     def isfile(self, pathname):
         """Returns true for files that exist on the device."""
         return self.ssh(['test', '-f', pathname]).call() == 0
@@ -210,13 +250,10 @@ class Device(object):
         try:
             process = self.ssh(['ls', '-l', pathname])
             # Suppress error messages
-            process.stderr = Host.DEVNULL
+            process.stderr = Host.devnull()
             out = process.check_output()
-            for line in str(out).split('\n'):
-                # Line ~= '-rw-r--r-- 1 0 0 8192 Mar 18 22:02 some-name'
-                parts = line.split()
-                if len(parts) > 8:
-                    results[' '.join(parts[8:])] = int(parts[4])
+            for match in Device.LS_RE.finditer(str(out)):
+                results[match.group('name')] = int(match.group('size'))
         except subprocess.CalledProcessError as e:
             # The returncode is 1 when the file or directory is not found (see
             # sbase/ls.c); for our purposes, this is not an error, but we don't
@@ -256,14 +293,14 @@ class Device(object):
           suitable candidate was found.
         """
         out = self.dump_log('--only', 'reset,Fuzzer,Sanitizer')
-        pid = -1
         if out:
-            for line in out.split('\n'):
+            # Only the last matching line matters, so search from the end.
+            for line in reversed(out.splitlines()):
                 # Log lines are like '[timestamp][pid][tid][name] data'
-                parts = line.split('][')
+                parts = line.split('][', 2)
                 if len(parts) > 2:
-                    pid = int(parts[1])
-        return pid
+                    return int(parts[1])
+        return -1
 
     def scp_rpath(self, pathname):
         """Returns an scp-style pathname argument for a remote path."""
@@ -300,13 +337,14 @@ class Device(object):
         self.mkdir(device_dst)
         device_dst = self.scp_rpath(device_dst)
 
+        host = self.host
         host_srcs = []
         for host_src in args:
-            host_srcs += self.host.glob(host_src)
+            host_srcs += host.glob(host_src)
 
         if not host_srcs:
-            self.host.error('No matching files: "{}".'.format(' '.join(args)))
+            host.error('No matching files: "{}".'.format(' '.join(args)))
 
         cmd = ['scp'] + self.ssh_opts() + host_srcs + [device_dst]
-        self.host.create_process(cmd).check_call()
+        host.create_process(cmd).check_call()
         return host_srcs
@@ -53,6 +53,12 @@ class Fuzzer(object):
     # limitations).
     LOG_PATTERN = 'fuzz-[0-9].log'
 
+    # Patterns used to find process IDs, mutation sequences, and artifacts in
+    # the fuzzer logs; see _symbolize_log_impl().
+    PID_RE = re.compile(r'^==([0-9]+)==')
+    MUT_RE = re.compile(r'^MS: [0-9]*')  # Fuzzer::DumpCurrentUnit
+    ART_RE = re.compile(r'Test unit written to (data/\S*)')
+
     # Default path for the ssh private key used to connect to a device.
     DEFAULT_SSH_KEY_PATH = '~/.ssh/fuchsia_ed25519'
 
@@ -235,12 +241,8 @@ class Fuzzer(object):
 
     def update(self, args):
         """Updates the properties of this fuzzer from matching arguments."""
-        keys = [
-            key for key, val in vars(Fuzzer).items()
-            if isinstance(val, property) and val.fset
-        ]
         for key, val in vars(args).items():
-            if key in keys and val is not None:
+            if key in _WRITABLE_PROPERTIES and val is not None:
                 setattr(self, key, val)
 
     def matches(self, name):
@@ -303,18 +305,20 @@ class Fuzzer(object):
         if self.is_resolved():
             return
         cmd = ['pkgctl', 'resolve', self.package_url]
-        self.device.ssh(cmd, stdout=Host.DEVNULL).check_call()
+        self.device.ssh(cmd, stdout=Host.devnull()).check_call()
         if self.is_resolved():
             return
         self.host.error('Failed to resolve package: {}'.format(self.package))
 
     def list_artifacts(self):
         """Returns a list of test unit artifacts in the output directory."""
-        artifacts = []
-        for prefix in Fuzzer.ARTIFACT_PREFIXES:
-            artifacts += self.host.glob(
-                os.path.join(self.output, '{}-*'.format(prefix)))
-        return artifacts
+        prefixes = tuple(
+            '{}-'.format(prefix) for prefix in Fuzzer.ARTIFACT_PREFIXES)
+        return [
+            pathname
+            for pathname in self.host.glob(os.path.join(self.output, '*-*'))
+            if os.path.basename(pathname).startswith(prefixes)
+        ]
 
     def is_running(self, refresh=False):
         """Checks the device and returns whether the fuzzer is running.
@@ -435,30 +439,33 @@ class Fuzzer(object):
         pid = -1
         sym = None
         artifacts = []
-        pid_pattern = re.compile(r'^==([0-9]+)==')
-        mut_pattern = re.compile(r'^MS: [0-9]*')  # Fuzzer::DumpCurrentUnit
-        art_pattern = re.compile(r'Test unit written to (data/\S*)')
+        host = self.host
+        device = self.device
+        write = fd_out.write
+        pid_search = Fuzzer.PID_RE.search
+        mut_search = Fuzzer.MUT_RE.search
+        art_search = Fuzzer.ART_RE.search
         for line in iter(fd_in.readline, ''):
-            pid_match = pid_pattern.search(line)
-            mut_match = mut_pattern.search(line)
-            art_match = art_pattern.search(line)
+            pid_match = pid_search(line)
+            mut_match = mut_search(line)
+            art_match = art_search(line)
             if pid_match:
                 pid = int(pid_match.group(1))
                 self._last_known_pid = pid
             if mut_match:
                 if pid <= 0:
-                    pid = self.device.guess_pid()
+                    pid = device.guess_pid()
                 if not sym:
-                    raw = self.device.dump_log('--pid', str(pid))
+                    raw = device.dump_log('--pid', str(pid))
                     sym = self.buildenv.symbolize(raw)
-                    fd_out.write(sym)
+                    write(sym)
                     if echo:
-                        self.host.echo(sym.strip())
+                        host.echo(sym.strip())
             if art_match:
                 artifacts.append(art_match.group(1))
-            fd_out.write(line)
+            write(line)
             if echo:
-                self.host.echo(line.strip())
+                host.echo(line.strip())
 
         if artifacts:
             self.ns.fetch(self.output, *artifacts)
@@ -472,8 +479,12 @@ class Fuzzer(object):
         combines and symbolizes the associated fuzzer and kernel logs. Fetches
         any referenced test artifacts, e.g. crashes.
         """
+        # Fuzzing campaigns can run for hours; back off between status checks
+        # so that long runs don't spend an SSH round trip every few seconds.
+        delay = 1
         while self.is_running(refresh=True):
-            self.host.sleep(2)
+            self.host.sleep(delay)
+            delay = min(delay * 1.5, 30)
 
         logs = self.ns.data(Fuzzer.LOG_PATTERN)
         self.ns.fetch(self.output, logs)
@@ -662,3 +673,10 @@ class Fuzzer(object):
         self.host.echo(
             'Generated coverage report, viewable at {}.'.format(
                 '{}/index.html'.format(coverage_dir)))
+
+
+# The settable properties of a Fuzzer, which Fuzzer.update() copies from
+# matching command line arguments.
+_WRITABLE_PROPERTIES = frozenset(
+    key for key, val in vars(Fuzzer).items()
+    if isinstance(val, property) and val.fset)
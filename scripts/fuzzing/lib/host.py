@@ -22,18 +22,28 @@ class Host(object):
         tracing:    Indicates if additional output is enabled.
     """
 
-    # Convenience file descriptor for silencing subprocess output
-    DEVNULL = open(os.devnull, 'w')
-
     # Used to pass tracing flag to tests in subprocesses.
     TRACE_ENVVAR = 'FX_FUZZ_TRACE'
 
+    # Shared file object for /dev/null; see devnull().
+    _devnull = None
+
     def __init__(self):
         self._platform = 'mac-x64' if os.uname()[0] == 'Darwin' else 'linux-x64'
         self._fd_out = sys.stdout
         self._fd_err = sys.stderr
         self._tracing = os.getenv(Host.TRACE_ENVVAR) == '1'
 
+    @staticmethod
+    def devnull():
+        """Returns a file object for silencing subprocess input and output.
+
+        The file is opened on first use and shared by all processes.
+        """
+        if not Host._devnull:
+            Host._devnull = open(os.devnull, 'r+')
+        return Host._devnull
+
     @property
     def platform(self):
         return self._platform
@@ -95,7 +95,10 @@ class DeviceTest(TestCaseWithFactory):
             self.buildenv.abspath(
                 self.buildenv.build_dir, 'ssh-keys', 'ssh_config'))
         self.assertTrue(device.ssh_identity)
-        self.assertFalse(device.ssh_options)
+        self.assertIn('ControlMaster=auto', device.ssh_options)
+        self.assertIn(
+            'ControlPath={}'.format(Device.CONTROL_PATH), device.ssh_options)
+        self.assertIn('ControlPersist=60s', device.ssh_options)
         self.assertFalse(device.ssh_verbosity)
 
     # These tests use a Device created by the TestCase
@@ -4,8 +4,10 @@
 # found in the LICENSE file.
 
 import errno
+import multiprocessing
 import os
 import shutil
+from multiprocessing.pool import ThreadPool
 
 
 def make_dir(file_path):
@@ -23,6 +25,26 @@ def make_dir(file_path):
     return file_path
 
 
+def link_or_copy(src, dst):
+    '''Hard links a file to the given destination, or copies it if that fails.
+
+    Linking avoids copying the data of large files, such as prebuilt binaries,
+    but the destination shares the source's contents and metadata. Only use it
+    for files that are never modified in place.
+
+    Args:
+        src: The source file.
+        dst: The destination file. Any existing file is replaced.
+    '''
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # E.g. the source and destination are on different filesystems.
+        shutil.copy2(src, dst)
+
+
 def copy_tree(src, dst, allow_overwrite=True):
     '''Recursively copies a directory into another.
 
@@ -42,6 +64,7 @@ def copy_tree(src, dst, allow_overwrite=True):
     '''
     if not os.path.isdir(dst):
         os.makedirs(dst)
+    copies = []
     for path, directories, files in os.walk(src):
 
         def get_path(name):
@@ -58,4 +81,22 @@ def copy_tree(src, dst, allow_overwrite=True):
             if not allow_overwrite and os.path.exists(dest):
                 raise Exception(
                     "cannot copy file: file '%s': File exists" % dest)
+            copies.append((source, dest))
+
+    # The directories now exist, so the files can be copied concurrently; the
+    # copies are I/O bound and shutil releases the GIL while copying.
+    if len(copies) < 2:
+        for source, dest in copies:
             shutil.copy2(source, dest)
+        return
+    pool = ThreadPool(min(len(copies), multiprocessing.cpu_count() * 2))
+    try:
+        pool.map(_copy_file, copies)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _copy_file(paths):
+    source, dest = paths
+    shutil.copy2(source, dest)
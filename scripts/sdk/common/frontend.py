@@ -17,7 +17,7 @@ import sys
 import tarfile
 import tempfile
 
-from files import make_dir
+from files import link_or_copy, make_dir
 
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _FUCHSIA_ROOT = os.path.dirname(  # $root
@@ -116,7 +116,8 @@ class Frontend(object):
             root='',
             destination='',
             result=[],
-            allow_overwrite=True):
+            allow_overwrite=True,
+            link=False):
         """Copies a file from a given root directory with a collector.
 
        Copies the file from the root directory into the same path in the
@@ -131,6 +132,8 @@ class Frontend(object):
       result: A collector list if not None, has the relative path of the file
         appended to the list.
       allow_overwrite: Whether to allow the destination file to be overwritten.
+      link: Whether to hard link rather than copy the file when possible. Only
+        suitable for files that are never modified, e.g. prebuilt binaries.
 
     Raises:
       Exception: If the path in file is not within the root directory.
@@ -143,7 +146,10 @@ class Frontend(object):
         if not allow_overwrite and os.path.exists(dest):
             raise Exception(
                 'Attempt to overwrite file: %s -> %s' % (filename, dest))
-        shutil.copy2(self.source(filename), dest)
+        if link:
+            link_or_copy(self.source(filename), dest)
+        else:
+            shutil.copy2(self.source(filename), dest)
         result.append(relative_path)
 
     def copy_files(
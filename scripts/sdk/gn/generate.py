@@ -12,6 +12,7 @@ construction of a specific SDK for use in projects using GN.
 import argparse
 import glob
 import json
+import multiprocessing
 import os
 import shutil
 import stat
@@ -19,6 +20,7 @@ import subprocess
 import sys
 import tarfile
 import xml.etree.ElementTree
+from multiprocessing.pool import ThreadPool
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 FUCHSIA_ROOT = os.path.dirname(  # $root
@@ -133,12 +135,27 @@ class GNBuilder(Frontend):
         ]  # List of all loadable module targets generated
         self.sysroot_targets = []  # List of all sysroot targets generated
         self.build_files = []
+        self._relpaths_to_output = {}  # Cache for _rel_to_output()
         if jiri_manifest:
             self.jiri_manifest = jiri_manifest
         else:
             self.jiri_manifest = os.path.join(
                 FUCHSIA_ROOT, '.jiri_root', 'update_history', 'latest')
 
+    def _rel_to_output(self, base):
+        """Returns the relative path from an atom's base directory to output.
+
+        Atom directories are siblings under a few category directories, e.g.
+        pkg/<name> and fidl/<name>, so the result is computed once per parent
+        directory rather than once per atom.
+        """
+        parent, _ = os.path.split(os.path.normpath(base))
+        relpath = self._relpaths_to_output.get(parent)
+        if relpath is None:
+            relpath = os.path.relpath(self.output, start=parent)
+            self._relpaths_to_output[parent] = relpath
+        return os.path.normpath(os.path.join(relpath, os.pardir))
+
     def prepare(self, arch, types):
         """Called before elements are processed.
 
@@ -178,10 +195,20 @@ class GNBuilder(Frontend):
         gn_path = os.path.join(
             FUCHSIA_ROOT, 'prebuilt', 'third_party', 'gn', '*', 'gn')
         gn = glob.glob(gn_path)[0]
-        # Format gn files.
-        for root, _, files in os.walk(self.output):
-            for f in (f for f in files if f.endswith(('.gn', '.gni'))):
-                subprocess.call([gn, 'format', os.path.join(root, f)])
+        # Format gn files. Each file is a separate gn process, so run them
+        # concurrently.
+        gn_files = [
+            os.path.join(root, f)
+            for root, _, files in os.walk(self.output)
+            for f in files
+            if f.endswith(('.gn', '.gni'))
+        ]
+        pool = ThreadPool(multiprocessing.cpu_count())
+        try:
+            pool.map(lambda f: subprocess.call([gn, 'format', f]), gn_files)
+        finally:
+            pool.close()
+            pool.join()
 
     def write_additional_files(self):
         self.write_file(self.dest('.gitignore'), 'gitignore', self)
@@ -277,7 +304,7 @@ class GNBuilder(Frontend):
         self.cc_prebuilt_targets.append(name)
         base = self.dest('pkg', name)
         library = model.CppPrebuiltLibrary(name)
-        library.relative_path_to_root = os.path.relpath(self.output, start=base)
+        library.relative_path_to_root = self._rel_to_output(base)
         library.is_static = atom['format'] == 'static'
 
         self.copy_files(atom['headers'], atom['root'], base, library.hdrs)
@@ -285,15 +312,15 @@ class GNBuilder(Frontend):
         for arch in self.target_arches:
             binaries = atom['binaries'][arch]
             prebuilt_set = model.CppPrebuiltSet(binaries['link'])
-            self.copy_file(binaries['link'])
+            self.copy_file(binaries['link'], link=True)
 
             if 'dist' in binaries:
                 prebuilt_set.dist_lib = binaries['dist']
                 prebuilt_set.dist_path = binaries['dist_path']
-                self.copy_file(binaries['dist'])
+                self.copy_file(binaries['dist'], link=True)
 
             if 'debug' in binaries:
-                self.copy_file(binaries['debug'])
+                self.copy_file(binaries['debug'], link=True)
 
             library.prebuilts[arch] = prebuilt_set
 
@@ -316,7 +343,7 @@ class GNBuilder(Frontend):
         self.cc_source_targets.append(name)
         base = self.dest('pkg', name)
         library = model.CppSourceLibrary(name)
-        library.relative_path_to_root = os.path.relpath(self.output, start=base)
+        library.relative_path_to_root = self._rel_to_output(base)
 
         self.copy_files(atom['headers'], atom['root'], base, library.hdrs)
         self.copy_files(atom['sources'], atom['root'], base, library.srcs)
@@ -339,7 +366,7 @@ class GNBuilder(Frontend):
         name = atom['name']
         base = self.dest('fidl', name)
         data = model.FidlLibrary(name, atom['name'])
-        data.relative_path_to_root = os.path.relpath(self.output, start=base)
+        data.relative_path_to_root = self._rel_to_output(base)
         data.short_name = name.split('.')[-1]
         data.namespace = '.'.join(name.split('.')[0:-1])
 
@@ -490,16 +517,20 @@ def get_prebuilts(in_extra_prebuilts, jiri_manifest):
     # Copy the input list since we modify it in the loop
     extra_prebuilts = in_extra_prebuilts.copy()
     prebuilt_results = {}
+    remaining_prebuilts = extra_prebuilts
+    # Stream the manifest rather than building the whole tree. Read it to the
+    # end so that a malformed manifest is still reported.
     try:
-        manifest_root = xml.etree.ElementTree.parse(jiri_manifest).getroot()
+        for _, element in xml.etree.ElementTree.iterparse(jiri_manifest):
+            if element.tag == 'package':
+                prebuilt = remaining_prebuilts.pop(
+                    element.attrib['name'], None)
+                if prebuilt:
+                    prebuilt_results[prebuilt] = element.attrib['version']
+            element.clear()
     except Exception as e:
         raise RuntimeError(
             'Unable to parse jiri manifest at %s: %s' % (jiri_manifest, e))
-    remaining_prebuilts = extra_prebuilts
-    for packages in manifest_root.iter('package'):
-        prebuilt = remaining_prebuilts.pop(packages.attrib['name'], None)
-        if prebuilt:
-            prebuilt_results[prebuilt] = packages.attrib['version']
     if remaining_prebuilts:
         raise RuntimeError(
             'Could not find entries in %s for the remaining EXTRA_PREBUILTS: %s'